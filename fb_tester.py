@@ -28,23 +28,254 @@ Usage examples:
 """
 
 import argparse
+import functools
 import json
-import random
-import string
+import secrets
 import sys
-import requests
-from urllib.parse import quote
-import base64
+import threading
+import time
+from types import SimpleNamespace
+import io
 import re
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Any, List, Set, Tuple
+
+try:
+    import orjson  # Optional, faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Timeout (seconds) for requests that do not need a check-specific value
+REQUEST_TIMEOUT = 10
+# Upper bound on concurrent requests issued by a single check
+MAX_WORKERS = 16
+# Largest non-200 response body worth reading just to return its connection to the pool
+MAX_DRAINED_BODY = 64 * 1024
+# How long (seconds) a cached GET response may be reused
+CACHE_TTL = 30
+# Returned by an auth-variant probe when the resource does not exist, so no other variant is tried
+PROBE_NOT_FOUND = object()
+# Response bodies of readable paths that hold no data and are not worth saving
+EMPTY_JSON_BODIES = frozenset((b'', b'null', b'{}', b'[]', b'""', b'0', b'false'))
+
+# Common top-level names guessed by the enumeration checks (lowercase, canonical form)
+RTDB_WORDLIST = frozenset({'users', 'logs', 'messages', 'posts', 'comments', 'profiles', 'settings', 'config'})
+FIRESTORE_WORDLIST = frozenset({'users', 'log', 'logs', 'upload', 'uploads', 'images', 'files', 'settings', 'messages', 'config'})
+
+# Patterns used by parse_firebase_config, compiled once at import time.
+# Strict JSON input opens with '{' followed by a quoted key (or closes straight away).
+_RE_JSON_OBJECT_START = re.compile(r'\{\s*["}]')
+# Line comments are only matched outside quoted strings (group 1) and not after a URL scheme colon.
+_RE_LINE_COMMENT = re.compile(r"""("(?:[^"\\\n]|\\.)*(?:"|$)|'(?:[^'\\\n]|\\.)*(?:'|$))|(?<!:)//.*$""", re.MULTILINE)
+_RE_BLOCK_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_RE_UNQUOTED_KEY = re.compile(r'(^|\s|[{,])\s*(\w+)(\s*):', re.MULTILINE)
+_RE_SINGLE_QUOTE_VAL = re.compile(r":\s*'([^']*)'")
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+# A "key: value" line that is not a # or // comment, split on the first colon that is not inside a quoted key
+_RE_KEY_VALUE_LINE = re.compile(r"""^(?![^\S\n]*(?:\#|//))[^\S\n]*("[^"\n]*"[^\S\n]*|'[^'\n]*'[^\S\n]*|[^:"'\n]+):(.*)$""", re.MULTILINE)
+# Tokens that split a JS-like object body: whole quoted strings, colons and commas
+_RE_JS_TOKEN = re.compile(r"""(?P<STRING>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|(?P<COLON>:)|(?P<COMMA>,)""", re.DOTALL)
+# Anything outside these is replaced when a config label becomes part of a saved file name
+_RE_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.-]')
+# Characters deleted from fallback keys
+_KEY_STRIP = str.maketrans('', '', ' \t\r\n\'"')
+
+# Raised by parse_firebase_config when no format matches
+_PARSE_ERROR_MSG = ("Unable to parse Firebase configuration. Please check the format.\n"
+                    "Supported formats:\n"
+                    '- JSON: {"apiKey":"value","authDomain":"value"}\n'
+                    "- Unquoted keys: {apiKey:'value',authDomain:'value'}\n"
+                    "- Mixed quotes: {apiKey:\"value\",authDomain:'value'}\n"
+                    "- Multiline with whitespace")
+
+
+def _with_casings(names) -> List[str]:
+    """Expand canonical lowercase names to the lowercase and Title-case variants that get probed"""
+    return [variant for name in sorted(names) for variant in (name, name.capitalize())]
+
+
+def _unquote(text: str) -> str:
+    """Remove one pair of matching outer quotes, if present"""
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in '"\'':
+        return text[1:-1]
+    return text
+
+
+def _decode_escapes(value: str) -> str:
+    """Expand backslash escape sequences (e.g. \\u0041) in a config value; values without any are returned as-is"""
+    if '\\' not in value:
+        return value
+    try:
+        # backslashreplace keeps non-Latin-1 characters intact through the unicode_escape decode
+        return value.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+    except UnicodeDecodeError:
+        return value
+
+
+def _build_urls(config: Dict[str, str], random_string: str) -> SimpleNamespace:
+    """Precompute every endpoint URL the checks use; URLs whose config fields are missing are None"""
+    api_key = config.get('apiKey')
+    storage_bucket = config.get('storageBucket')
+    database_url = config.get('databaseURL')
+    project_id = config.get('projectId')
+    app_id = config.get('appId')
+    sender_id = config.get('messagingSenderId')
+    poc_filename = f"poc_{random_string}.json"
+    storage_base = f"https://firebasestorage.googleapis.com/v0/b/{storage_bucket}/o"
+    firestore_base = f"https://firestore.googleapis.com/v1/projects/{project_id}/databases/(default)/documents"
+    
+    return SimpleNamespace(
+        signup=f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={api_key}" if api_key else None,
+        storage_list=storage_base if storage_bucket else None,
+        storage_upload=f"{storage_base}?name={poc_filename}" if storage_bucket else None,
+        storage_object=f"{storage_base}/{poc_filename}?alt=media" if storage_bucket else None,
+        gcs_root=f"https://storage.googleapis.com/{storage_bucket}/" if storage_bucket else None,
+        db_put_o=f"{database_url}/o/poc_{random_string}.json" if database_url else None,
+        db_post_o=f"{database_url}/o/poc_{random_string}_post.json" if database_url else None,
+        db_put_direct=f"{database_url}/poc_{random_string}.json" if database_url else None,
+        db_post_direct=f"{database_url}/poc_{random_string}_post.json" if database_url else None,
+        remote_config=(f"https://firebaseremoteconfig.googleapis.com/v1/projects/{sender_id}/namespaces/firebase:fetch?key={api_key}"
+                       if sender_id and api_key else None),
+        crashlytics=(f"https://firebasecrashlytics.googleapis.com/v1/projects/{project_id or 'unknown'}/apps/{app_id}/issues"
+                     if app_id else None),
+        firestore_documents=firestore_base if project_id else None,
+        firestore_batch_get=f"{firestore_base}:batchGet" if project_id else None,
+    )
+
+
+def _json_loads(data):
+    """Decode JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Encode an object as JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_dumps_pretty(obj: Any) -> bytes:
+    """Encode an object as indented JSON bytes in one buffer, ready for a single file write"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+# requests (with urllib3, idna, certifi, ...) is imported on first use so --help and
+# argument errors return without paying its import cost
+requests = None
+
+
+def _get_requests():
+    """Import requests on first call and bind it to the module-level name"""
+    global requests
+    if requests is None:
+        import requests as _requests
+        requests = _requests
+    return requests
+
+
+class CachingSession:
+    """Wrap a requests.Session and briefly cache GET responses keyed on (url, Authorization)
+    
+    A single run never repeats a GET, so this only pays off when run_all_checks is called
+    more than once on the same tester; it is off unless use_cache=True is passed, and it
+    holds every cached response body in memory until it expires.
+    Writes (PUT/POST) to a URL drop its cached responses so verification reads stay fresh.
+    Every other attribute is delegated to the wrapped session.
+    """
+    CACHEABLE_STATUS_CODES = (200, 401, 403, 404)
+    
+    def __init__(self, session: 'requests.Session', ttl: float = CACHE_TTL):
+        self._inner = session
+        self._ttl = ttl
+        self._cache = {}
+    
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> 'requests.Response':
+        key = (url, (headers or {}).get('Authorization', ''))
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._ttl:
+            return cached[1]
+        
+        response = self._inner.get(url, headers=headers, **kwargs)
+        if response.status_code == 200:
+            response.content  # Read streamed bodies now so later callers can reuse them
+        elif kwargs.get('stream') or response.status_code not in self.CACHEABLE_STATUS_CODES:
+            return response
+        self._cache[key] = (time.monotonic(), response)
+        return response
+    
+    def post(self, url: str, **kwargs) -> 'requests.Response':
+        self._invalidate(url)
+        return self._inner.post(url, **kwargs)
+    
+    def put(self, url: str, **kwargs) -> 'requests.Response':
+        self._invalidate(url)
+        return self._inner.put(url, **kwargs)
+    
+    def _invalidate(self, url: str):
+        for key in [key for key in list(self._cache) if key[0] == url]:
+            self._cache.pop(key, None)
+
 
 class FirebaseConfigTester:
-    def __init__(self, config: Dict[str, str], debug: bool = False):
+    def __init__(self, config: Dict[str, str], debug: bool = False, use_cache: bool = False, verify_uploads: bool = False,
+                 output_prefix: str = ''):
+        # Per-thread output capture used while checks run concurrently; set first because
+        # config derivation already prints debug lines through _print
+        self._output = threading.local()
         self.debug = debug
+        self.use_cache = use_cache
+        self.verify_uploads = verify_uploads
+        # Prepended to every saved file name, so batch runs don't overwrite each other's results
+        self.output_prefix = output_prefix
         self.config = self._parse_config(config)
         self.config = self._derive_missing_fields(self.config)
         self.id_token = None
-        self.random_string = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+        self._build_auth_variants()
+        self.random_string = secrets.token_hex(4)
+        # The PoC payload only depends on random_string, so encode it once for every write check
+        self._poc_body = _json_dumps({"poc": self.random_string}).encode()
+        self._poc_body_str = self._poc_body.decode()
+        # Every endpoint depends only on the config and random_string, so build them all once
+        self._urls = _build_urls(self.config, self.random_string)
+        self.session = self._create_session()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def _create_session(self):
+        """Create a shared HTTP session so all checks reuse keep-alive connections"""
+        requests = _get_requests()
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        # Transient gateway errors are retried briefly; raise_on_status=False still hands the
+        # final 5xx response to the checks so they can report its status. Connection and read
+        # errors are not retried, so timeouts surface once as Timeout instead of costing 3x
+        retries = Retry(total=2, connect=0, read=False, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                        raise_on_status=False)
+        # One pool per API host (about eight); each pool keeps enough connections alive for a full
+        # probe fan-out plus the other checks hitting the same host at the same time
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=MAX_WORKERS * 2, max_retries=retries)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({'User-Agent': 'fb-tester/1.0'})
+        if self.use_cache:
+            return CachingSession(session)
+        return session
         
     def _derive_missing_fields(self, config: Dict[str, str]) -> Dict[str, str]:
         """Derive missing fields from available configuration fields"""
@@ -57,7 +288,7 @@ class FirebaseConfigTester:
                 project_id = auth_domain.replace('.firebaseapp.com', '')
                 derived_config['projectId'] = project_id
                 if self.debug:
-                    print(f"DEBUG: Derived projectId '{project_id}' from authDomain '{auth_domain}'")
+                    self._print(f"DEBUG: Derived projectId '{project_id}' from authDomain '{auth_domain}'")
         
         # Try to derive databaseURL from projectId or authDomain
         if 'databaseURL' not in derived_config:
@@ -65,14 +296,14 @@ class FirebaseConfigTester:
             if project_id:
                 derived_config['databaseURL'] = f"https://{project_id}-default-rtdb.firebaseio.com"
                 if self.debug:
-                    print(f"DEBUG: Derived databaseURL from projectId: {derived_config['databaseURL']}")
+                    self._print(f"DEBUG: Derived databaseURL from projectId: {derived_config['databaseURL']}")
             elif 'authDomain' in derived_config:
                 auth_domain = derived_config['authDomain']
                 if '.firebaseapp.com' in auth_domain:
                     project_id = auth_domain.replace('.firebaseapp.com', '')
                     derived_config['databaseURL'] = f"https://{project_id}-default-rtdb.firebaseio.com"
                     if self.debug:
-                        print(f"DEBUG: Derived databaseURL from authDomain: {derived_config['databaseURL']}")
+                        self._print(f"DEBUG: Derived databaseURL from authDomain: {derived_config['databaseURL']}")
         
         # Try to derive storageBucket from projectId or authDomain
         if 'storageBucket' not in derived_config:
@@ -80,45 +311,140 @@ class FirebaseConfigTester:
             if project_id:
                 derived_config['storageBucket'] = f"{project_id}.appspot.com"
                 if self.debug:
-                    print(f"DEBUG: Derived storageBucket from projectId: {derived_config['storageBucket']}")
+                    self._print(f"DEBUG: Derived storageBucket from projectId: {derived_config['storageBucket']}")
             elif 'authDomain' in derived_config:
                 auth_domain = derived_config['authDomain']
                 if '.firebaseapp.com' in auth_domain:
                     project_id = auth_domain.replace('.firebaseapp.com', '')
                     derived_config['storageBucket'] = f"{project_id}.appspot.com"
                     if self.debug:
-                        print(f"DEBUG: Derived storageBucket from authDomain: {derived_config['storageBucket']}")
+                        self._print(f"DEBUG: Derived storageBucket from authDomain: {derived_config['storageBucket']}")
         
         return derived_config
     
     def _parse_config(self, config: Dict[str, str]) -> Dict[str, str]:
         """Parse and clean the Firebase configuration"""
-        # Handle unicode escape sequences
-        config_str = json.dumps(config)
-        config_str = config_str.encode().decode('unicode_escape')
+        # Clean up the config (drop empty values, strip spaces, expand escape sequences)
+        return {key: _decode_escapes(str(value)).strip() for key, value in config.items() if value}
+    
+    def _build_auth_variants(self):
+        """Precompute the (auth_type, filename slug, headers) combinations every check iterates over"""
+        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
+        self._auth_variants = [("anonymous", "anonymous", {})]
+        if self.id_token:
+            self._auth_variants.append(("authenticated (Bearer)", "authenticated-Bearer", {"Authorization": f"Bearer {self.id_token}"}))
+            self._auth_variants.append(("authenticated (Firebase)", "authenticated-Firebase", {"Authorization": f"Firebase {self.id_token}"}))
+    
+    def _print(self, message: str = ""):
+        """Print a line, or buffer it if the current thread's output is being captured"""
+        buffer = getattr(self._output, 'buffer', None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.write(message)
+            buffer.write('\n')
+    
+    def _run_captured(self, check) -> str:
+        """Run a check and return its printed output instead of writing it to stdout"""
+        self._output.buffer = io.StringIO()
+        try:
+            check()
+        finally:
+            buffer, self._output.buffer = self._output.buffer, None
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _write_output(output: str):
+        """Write one check's captured output in a single call and flush it, so piped output shows up per check"""
+        sys.stdout.write(output)
+        sys.stdout.flush()
+    
+    def _print_debug(self, message: str, curl_builder: Optional[Callable[[], str]] = None):
+        """Print debug information if debug mode is enabled
         
-        # Clean up the config (remove quotes, spaces, etc.)
-        cleaned_config = {}
-        for key, value in json.loads(config_str).items():
-            if value:
-                cleaned_config[key] = str(value).strip()
+        The curl command is passed as a builder so it is only formatted when it will be printed.
+        """
+        if self.debug:
+            self._print(f"DEBUG: {message}")
+            if curl_builder:
+                self._print(f"CURL: {curl_builder()}")
+    
+    @staticmethod
+    def _curl(url: str, headers: Optional[Dict[str, str]] = None, method: Optional[str] = None, data: Optional[str] = None) -> str:
+        """Format the curl command equivalent to a request, for debug output"""
+        parts = ["curl"]
+        if method:
+            parts.append(f"-X {method}")
+        parts.append(f"'{url}'")
+        parts.extend(f"-H '{name}: {value}'" for name, value in (headers or {}).items())
+        if data is not None:
+            parts.append(f"-d '{data}'")
+        return " ".join(parts)
+    
+    def _iter_auth_modes(self, extra: Optional[Dict[str, str]] = None):
+        """Yield (auth_type, auth_slug, headers) for each auth variant, with any extra headers merged in"""
+        for auth_type, auth_slug, headers in self._auth_variants:
+            yield auth_type, auth_slug, {**headers, **extra} if extra else headers
+    
+    def _probe_auth_variants(self, probe: Callable[[str, str, Dict[str, str]], Any], extra: Optional[Dict[str, str]] = None):
+        """Run probe(auth_type, auth_slug, headers) for each auth variant, anonymous first
+        
+        Authentication only widens access, so the authenticated variants are skipped once the
+        anonymous probe succeeds, or when it returns PROBE_NOT_FOUND because the resource does
+        not exist for anyone; otherwise they run concurrently and report in the usual order.
+        """
+        (auth_type, auth_slug, headers), *authenticated = self._iter_auth_modes(extra)
+        result = probe(auth_type, auth_slug, headers)
+        if result is PROBE_NOT_FOUND:
+            if authenticated:
+                self._print("- Skipping authenticated re-check (not found anonymously)")
+            return
+        if result:
+            if authenticated:
+                self._print("- Skipping authenticated re-check (anonymous already succeeded)")
+            return
+        if not authenticated:
+            return
         
-        return cleaned_config
+        with ThreadPoolExecutor(max_workers=len(authenticated)) as executor:
+            outputs = list(executor.map(lambda variant: self._run_captured(lambda: probe(*variant)), authenticated))
+        for output in outputs:
+            if output:
+                self._print(output.rstrip('\n'))
     
-    def _print_debug(self, message: str, curl_command: str = None):
-        """Print debug information if debug mode is enabled"""
-        if self.debug:
-            print(f"DEBUG: {message}")
-            if curl_command:
-                print(f"CURL: {curl_command}")
+    def _get_concurrently(self, jobs: List[Tuple[str, Dict[str, str]]], timeout: int) -> List[Tuple[Optional['requests.Response'], Optional[Exception]]]:
+        """Issue independent GET requests concurrently, returning (response, error) pairs in job order
+        
+        Callers only inspect the status of non-200 responses, so large error bodies
+        are never downloaded; small ones are drained to keep the connection reusable.
+        """
+        def fetch(job):
+            url, headers = job
+            try:
+                response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+                if response.status_code == 200:
+                    response.content  # Read the body while still inside the worker thread
+                elif int(response.headers.get('Content-Length', MAX_DRAINED_BODY + 1)) <= MAX_DRAINED_BODY:
+                    response.content
+                else:
+                    response.close()
+                return response, None
+            except Exception as e:
+                return None, e
+        
+        if len(jobs) <= 1:
+            return [fetch(job) for job in jobs]
+        # Don't start more threads than there are requests to overlap
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as executor:
+            return list(executor.map(fetch, jobs))
     
     def check_registration(self, email: str, password: str) -> bool:
         """Check if registration is possible with provided apiKey"""
         if 'apiKey' not in self.config:
-            print("No apiKey provided, skipping registration check")
+            self._print("No apiKey provided, skipping registration check")
             return False
         
-        url = f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={self.config['apiKey']}"
+        url = self._urls.signup
         headers = {'Content-Type': 'application/json'}
         
         # Test 1: Email/password registration (prioritized)
@@ -128,694 +454,607 @@ class FirebaseConfigTester:
             "returnSecureToken": True
         }
         
-        curl_cmd = f"curl '{url}' -H 'Content-Type: application/json' --data '{json.dumps(data)}'"
-        self._print_debug(f"Checking email/password registration at {url}", curl_cmd)
+        self._print_debug(f"Checking email/password registration at {url}",
+                          lambda: self._curl(url, headers, data=_json_dumps(data)))
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                print(f"✓ Email/password registration successful with apiKey (status: {response.status_code})")
-                result = response.json()
+                self._print(f"✓ Email/password registration successful with apiKey (status: {response.status_code})")
+                result = _json_loads(response.content)
                 self.id_token = result.get('idToken')
+                self._build_auth_variants()
                 return True
             elif response.status_code == 400:
-                print(f"✗ Email/password registration not allowed (status: {response.status_code})")
+                self._print(f"✗ Email/password registration not allowed (status: {response.status_code})")
             else:
-                print(f"✗ Email/password registration check failed (status: {response.status_code})")
+                self._print(f"✗ Email/password registration check failed (status: {response.status_code})")
         except Exception as e:
-            print(f"✗ Email/password registration check error: {e}")
+            self._print(f"✗ Email/password registration check error: {e}")
         
         # Test 2: Anonymous registration (fallback)
-        print("Trying anonymous registration as fallback...")
+        self._print("Trying anonymous registration as fallback...")
         anonymous_data = {}
-        curl_cmd_anon = f"curl '{url}' -H 'Content-Type: application/json' --data '{{}}'"
-        self._print_debug(f"Checking anonymous registration at {url}", curl_cmd_anon)
+        self._print_debug(f"Checking anonymous registration at {url}",
+                          lambda: self._curl(url, headers, data=_json_dumps(anonymous_data)))
         
         try:
-            response = requests.post(url, headers=headers, json=anonymous_data)
+            response = self.session.post(url, headers=headers, json=anonymous_data, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                print(f"✓ Anonymous registration successful with apiKey (status: {response.status_code})")
-                result = response.json()
+                self._print(f"✓ Anonymous registration successful with apiKey (status: {response.status_code})")
+                result = _json_loads(response.content)
                 self.id_token = result.get('idToken')
+                self._build_auth_variants()
                 return True
             elif response.status_code == 400:
-                print(f"✗ Anonymous registration not allowed (status: {response.status_code})")
+                self._print(f"✗ Anonymous registration not allowed (status: {response.status_code})")
                 return False
             else:
-                print(f"✗ Anonymous registration check failed (status: {response.status_code})")
+                self._print(f"✗ Anonymous registration check failed (status: {response.status_code})")
                 return False
         except Exception as e:
-            print(f"✗ Anonymous registration check error: {e}")
+            self._print(f"✗ Anonymous registration check error: {e}")
             return False
     
     def check_storage_bucket(self):
         """Check if storageBucket is accessible"""
         if 'storageBucket' not in self.config:
-            print("No storageBucket provided, skipping check")
+            self._print("No storageBucket provided, skipping check")
             return
         
         storage_bucket = self.config['storageBucket']
         
         # Check via firebasestorage.googleapis.com
-        print(f"\nChecking storage bucket: {storage_bucket}")
+        self._print(f"\nChecking storage bucket: {storage_bucket}")
         
-        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
-        headers_list = [{}]
-        if self.id_token:
-            headers_list.append({"Authorization": f"Bearer {self.id_token}"})
-            headers_list.append({"Authorization": f"Firebase {self.id_token}"})
-        
-        for i, headers in enumerate(headers_list):
-            if not headers:
-                auth_type = "anonymous"
-            elif "Bearer" in headers.get("Authorization", ""):
-                auth_type = "authenticated (Bearer)"
-            else:
-                auth_type = "authenticated (Firebase)"
-            
-            # Firebase Storage API
-            url = f"https://firebasestorage.googleapis.com/v0/b/{storage_bucket}/o"
-            curl_cmd = f"curl '{url}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Checking {url} ({auth_type})", curl_cmd)
+        # Firebase Storage API and Google Cloud Storage API listing URLs
+        storage_url = self._urls.storage_list
+        gcs_url = self._urls.gcs_root
+        
+        # Firebase Storage API
+        def probe_storage(auth_type: str, auth_slug: str, headers: Dict[str, str]) -> Any:
+            self._print_debug(f"Checking {storage_url} ({auth_type})", lambda: self._curl(storage_url, headers))
             
             try:
-                response = requests.get(url, headers=headers)
+                response = self.session.get(storage_url, headers=headers, timeout=REQUEST_TIMEOUT)
                 if response.status_code == 200:
-                    print(f"✓ Storage bucket accessible ({auth_type}) (status: {response.status_code})")
-                    print(f"  URL: {url}")
+                    self._print(f"✓ Storage bucket accessible ({auth_type}) (status: {response.status_code})")
+                    self._print(f"  URL: {storage_url}")
                     
                     # Save storage listing to file
                     try:
-                        listing_data = response.json()
-                        filename = f"storage-listing-{auth_type.replace(' ', '-').replace('(', '').replace(')', '')}.json"
-                        with open(filename, 'w') as f:
-                            json.dump(listing_data, f, indent=2)
-                        print(f"  Listing saved to {filename}")
+                        filename = f"{self.output_prefix}storage-listing-{auth_slug}.json"
+                        with open(filename, 'wb') as f:
+                            f.write(response.content)
+                        self._print(f"  Listing saved to {filename}")
                     except Exception as e:
-                        print(f"  Could not save listing: {e}")
-                        
+                        self._print(f"  Could not save listing: {e}")
+                    return True
                 elif response.status_code == 404:
-                    print(f"✗ Storage bucket not found ({auth_type}) (status: {response.status_code})")
+                    self._print(f"✗ Storage bucket not found ({auth_type}) (status: {response.status_code})")
+                    return PROBE_NOT_FOUND
                 else:
-                    print(f"✗ Storage bucket check failed ({auth_type}) (status: {response.status_code})")
+                    self._print(f"✗ Storage bucket check failed ({auth_type}) (status: {response.status_code})")
             except Exception as e:
-                print(f"✗ Storage bucket check error ({auth_type}): {e}")
-            
-            # Google Cloud Storage API
-            url = f"https://storage.googleapis.com/{storage_bucket}/"
-            curl_cmd = f"curl '{url}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Checking {url} ({auth_type})", curl_cmd)
+                self._print(f"✗ Storage bucket check error ({auth_type}): {e}")
+            return False
+        
+        # Google Cloud Storage API
+        def probe_gcs(auth_type: str, auth_slug: str, headers: Dict[str, str]) -> Any:
+            self._print_debug(f"Checking {gcs_url} ({auth_type})", lambda: self._curl(gcs_url, headers))
             
             try:
-                response = requests.get(url, headers=headers)
+                response = self.session.get(gcs_url, headers=headers, timeout=REQUEST_TIMEOUT)
                 if response.status_code == 200:
-                    print(f"✓ Google Cloud Storage accessible ({auth_type}) (status: {response.status_code})")
-                    print(f"  URL: {url}")
-                else:
-                    print(f"✗ Google Cloud Storage check failed ({auth_type}) (status: {response.status_code})")
+                    self._print(f"✓ Google Cloud Storage accessible ({auth_type}) (status: {response.status_code})")
+                    self._print(f"  URL: {gcs_url}")
+                    return True
+                if response.status_code == 404:
+                    self._print(f"✗ Google Cloud Storage bucket not found ({auth_type}) (status: {response.status_code})")
+                    return PROBE_NOT_FOUND
+                self._print(f"✗ Google Cloud Storage check failed ({auth_type}) (status: {response.status_code})")
             except Exception as e:
-                print(f"✗ Google Cloud Storage check error ({auth_type}): {e}")
+                self._print(f"✗ Google Cloud Storage check error ({auth_type}): {e}")
+            return False
+        
+        # A missing bucket is 404 on either API regardless of auth, so an anonymous 404
+        # ends that host's probes without the authenticated listing requests.
+        # The two hosts are independent, so probe them concurrently and report in order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            outputs = list(executor.map(
+                lambda probe: self._run_captured(lambda: self._probe_auth_variants(probe)),
+                (probe_storage, probe_gcs)
+            ))
+        for output in outputs:
+            if output:
+                self._print(output.rstrip('\n'))
     
     def check_storage_upload(self):
         """Check if uploading to storageBucket is possible"""
         if 'storageBucket' not in self.config:
-            print("No storageBucket provided, skipping upload check")
+            self._print("No storageBucket provided, skipping upload check")
             return
         
-        storage_bucket = self.config['storageBucket']
-        filename = f"poc_{self.random_string}.json"
-        upload_data = {"poc": self.random_string}
+        self._print("\nChecking storage upload capability")
         
-        print(f"\nChecking storage upload capability")
+        url = self._urls.storage_upload
+        verify_url = self._urls.storage_object
         
-        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
-        headers_list = [{"Content-Type": "application/json"}]
-        if self.id_token:
-            headers_list.append({
-                "Authorization": f"Bearer {self.id_token}",
-                "Content-Type": "application/json"
-            })
-            headers_list.append({
-                "Authorization": f"Firebase {self.id_token}",
-                "Content-Type": "application/json"
-            })
-        
-        for i, headers in enumerate(headers_list):
-            if "Authorization" not in headers:
-                auth_type = "anonymous"
-            elif "Bearer" in headers.get("Authorization", ""):
-                auth_type = "authenticated (Bearer)"
-            else:
-                auth_type = "authenticated (Firebase)"
-            
+        def upload(auth_type: str, auth_slug: str, headers: Dict[str, str]) -> bool:
             # Upload file
-            url = f"https://firebasestorage.googleapis.com/v0/b/{storage_bucket}/o?name={filename}"
-            curl_cmd = f"curl -X POST '{url}' -H 'Content-Type: application/json'"
-            if "Authorization" in headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            curl_cmd += f" -d '{json.dumps(upload_data)}'"
-            self._print_debug(f"Attempting upload ({auth_type})", curl_cmd)
+            self._print_debug(f"Attempting upload ({auth_type})",
+                              lambda: self._curl(url, headers, method="POST", data=self._poc_body_str))
             
             try:
-                response = requests.post(url, headers=headers, json=upload_data)
+                response = self.session.post(url, headers=headers, data=self._poc_body, timeout=REQUEST_TIMEOUT)
                 if response.status_code == 200:
-                    print(f"✓ Upload successful ({auth_type}) (status: {response.status_code})")
+                    self._print(f"✓ Upload successful ({auth_type}) (status: {response.status_code})")
                     
-                    # Verify upload
-                    verify_url = f"https://firebasestorage.googleapis.com/v0/b/{storage_bucket}/o/{filename}?alt=media"
-                    verify_response = requests.get(verify_url)
-                    if verify_response.status_code == 200:
-                        print(f"✓ Upload verified ({auth_type}) (status: {verify_response.status_code})")
-                        print(f"  URL: {verify_url}")
-                    else:
-                        print(f"✗ Upload verification failed ({auth_type}) (status: {verify_response.status_code})")
-                else:
-                    print(f"✗ Upload failed ({auth_type}) (status: {response.status_code})")
+                    # The upload response already carries the object metadata, including its download token
+                    try:
+                        metadata = _json_loads(response.content)
+                    except ValueError:
+                        metadata = None
+                    if isinstance(metadata, dict) and metadata.get('name'):
+                        token = (metadata.get('downloadTokens') or '').split(',')[0]
+                        self._print(f"  Object: {metadata['name']}")
+                        if token:
+                            self._print(f"  URL: {verify_url}&token={token}")
+                    
+                    # Anonymous read-back is a separate permission, only tested on request
+                    if self.verify_uploads:
+                        verify_response = self.session.get(verify_url, timeout=REQUEST_TIMEOUT)
+                        if verify_response.status_code == 200:
+                            self._print(f"✓ Upload verified ({auth_type}) (status: {verify_response.status_code})")
+                            self._print(f"  URL: {verify_url}")
+                        else:
+                            self._print(f"✗ Upload verification failed ({auth_type}) (status: {verify_response.status_code})")
+                    return True
+                self._print(f"✗ Upload failed ({auth_type}) (status: {response.status_code})")
             except Exception as e:
-                print(f"✗ Upload check error ({auth_type}): {e}")
+                self._print(f"✗ Upload check error ({auth_type}): {e}")
+            return False
+        
+        self._probe_auth_variants(upload, extra={"Content-Type": "application/json"})
+    
+    def _rtdb_top_keys(self, database_url: str) -> List[Optional[Set[str]]]:
+        """List the database root keys with a shallow read for each auth variant (None where the root is not readable)"""
+        url = f"{database_url}/.json?shallow=true"
+        if self.debug:
+            for auth_type, _, headers in self._iter_auth_modes():
+                self._print_debug(f"Listing database root keys ({auth_type})", lambda: self._curl(url, headers))
+        
+        top_keys = []
+        for response, error in self._get_concurrently([(url, headers) for _, _, headers in self._iter_auth_modes()], timeout=5):
+            try:
+                data = _json_loads(response.content) if response is not None and response.status_code == 200 else None
+            except ValueError:
+                data = None
+            if data is None:
+                top_keys.append(None)
+            else:
+                top_keys.append(set(data) if isinstance(data, dict) else set())
+        return top_keys
     
     def check_database_accessibility(self):
         """Check general database accessibility for common endpoints"""
         if 'databaseURL' not in self.config:
-            print("No databaseURL provided, skipping accessibility checks")
+            self._print("No databaseURL provided, skipping accessibility checks")
             return
         
         database_url = self.config['databaseURL']
         
-        print(f"\nChecking database general accessibility")
-        
-        # Common Firebase database endpoints to check
-        endpoints = [
-            "/.json",
-            "/Users.json",
-            "/users.json",
-            "/Logs.json",
-            "/logs.json",
-            "/Messages.json",
-            "/messages.json",
-            "/Posts.json",
-            "/posts.json",
-            "/Comments.json",
-            "/comments.json",
-            "/Profiles.json",
-            "/profiles.json",
-            "/Settings.json",
-            "/settings.json",
-            "/Config.json",
-            "/config.json"
-        ]
-        
-        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
-        headers_list = [{}]
-        if self.id_token:
-            headers_list.append({"Authorization": f"Bearer {self.id_token}"})
-            headers_list.append({"Authorization": f"Firebase {self.id_token}"})
-        
-        for i, headers in enumerate(headers_list):
-            if not headers:
-                auth_type = "anonymous"
-            elif "Bearer" in headers.get("Authorization", ""):
-                auth_type = "authenticated (Bearer)"
+        self._print("\nChecking database general accessibility")
+        
+        # Common Firebase database endpoints to check, in both usual casings
+        endpoints = ["/.json"] + [f"/{name}.json" for name in _with_casings(RTDB_WORDLIST)]
+        
+        # When the root can be listed, only probe the wordlist keys that actually exist there, in
+        # their real casing. A root that an earlier auth variant already listed with the same keys
+        # holds the same data, so its contents are not downloaded again.
+        all_top_keys = self._rtdb_top_keys(database_url)
+        auth_endpoints = []
+        for i, top_keys in enumerate(all_top_keys):
+            if top_keys is None:
+                auth_endpoints.append(endpoints)
+            elif top_keys in all_top_keys[:i]:
+                auth_endpoints.append([])
             else:
-                auth_type = "authenticated (Firebase)"
+                auth_endpoints.append(["/.json"] + [f"/{key}.json" for key in sorted(top_keys) if key.lower() in RTDB_WORDLIST])
+        
+        endpoint_urls = {endpoint: f"{database_url}{endpoint}" for probe_endpoints in auth_endpoints for endpoint in probe_endpoints}
+        
+        # Probe every (auth, endpoint) pair concurrently, then report results in order
+        results = iter(self._get_concurrently(
+            [(endpoint_urls[endpoint], headers)
+             for (_, _, headers), probe_endpoints in zip(self._iter_auth_modes(), auth_endpoints) for endpoint in probe_endpoints],
+            timeout=5
+        ))
+        
+        for (auth_type, auth_slug, headers), top_keys, probe_endpoints in zip(self._iter_auth_modes(), all_top_keys, auth_endpoints):
             accessible_endpoints = []
+            if top_keys is not None and not probe_endpoints:
+                same_as = self._auth_variants[all_top_keys.index(top_keys)][0]
+                self._print(f"- Database root keys readable ({auth_type}): same {len(top_keys)} keys as {same_as}, skipping duplicate reads")
+                continue
+            if top_keys is not None:
+                self._print(f"- Database root keys readable ({auth_type}): {len(top_keys)} keys, probing {len(probe_endpoints)} endpoints")
             
-            for endpoint in endpoints:
-                url = f"{database_url}{endpoint}"
-                curl_cmd = f"curl '{url}'"
-                if headers:
-                    curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-                
-                try:
-                    response = requests.get(url, headers=headers, timeout=5)
-                    if response.status_code == 200:
-                        accessible_endpoints.append(endpoint)
-                        print(f"✓ Database endpoint accessible ({auth_type}): {endpoint} (status: {response.status_code})")
-                        
-                        # Save data if it contains content
-                        try:
-                            data = response.json()
-                            if data:  # Only save if there's actual data
-                                filename = f"database-{endpoint.replace('/', '').replace('.json', '')}-{auth_type.replace(' ', '-').replace('(', '').replace(')', '')}.json"
-                                with open(filename, 'w') as f:
-                                    json.dump(data, f, indent=2)
-                                print(f"  Data saved to {filename}")
-                        except Exception as e:
-                            print(f"  Could not parse/save data: {e}")
-                    elif response.status_code == 401:
-                        print(f"✗ Database endpoint requires auth ({auth_type}): {endpoint} (status: {response.status_code})")
-                    elif response.status_code == 404:
-                        # Don't print for 404s as this is expected for non-existent paths
-                        pass
-                    else:
-                        print(f"- Database endpoint ({auth_type}): {endpoint} (status: {response.status_code})")
-                except requests.exceptions.Timeout:
-                    print(f"- Database endpoint timeout ({auth_type}): {endpoint}")
-                except Exception as e:
+            for endpoint in probe_endpoints:
+                response, error = next(results)
+                if isinstance(error, requests.exceptions.Timeout):
+                    self._print(f"- Database endpoint timeout ({auth_type}): {endpoint}")
+                    continue
+                elif error is not None:
                     # Silently skip connection errors for non-existent endpoints
+                    continue
+                
+                if response.status_code == 200:
+                    accessible_endpoints.append(endpoint)
+                    self._print(f"✓ Database endpoint accessible ({auth_type}): {endpoint} (status: {response.status_code})")
+                    
+                    # Save data if it contains content
+                    try:
+                        if response.content.strip() not in EMPTY_JSON_BODIES:  # Only save if there's actual data
+                            filename = f"{self.output_prefix}database-{endpoint.replace('/', '').replace('.json', '')}-{auth_slug}.json"
+                            with open(filename, 'wb') as f:
+                                f.write(response.content)
+                            self._print(f"  Data saved to {filename}")
+                    except Exception as e:
+                        self._print(f"  Could not save data: {e}")
+                elif response.status_code == 401:
+                    self._print(f"✗ Database endpoint requires auth ({auth_type}): {endpoint} (status: {response.status_code})")
+                elif response.status_code == 404:
+                    # Don't print for 404s as this is expected for non-existent paths
                     pass
+                else:
+                    self._print(f"- Database endpoint ({auth_type}): {endpoint} (status: {response.status_code})")
             
             if accessible_endpoints:
-                print(f"\nSummary ({auth_type}): Found {len(accessible_endpoints)} accessible endpoints")
+                self._print(f"\nSummary ({auth_type}): Found {len(accessible_endpoints)} accessible endpoints")
             else:
-                print(f"\nSummary ({auth_type}): No accessible endpoints found")
+                self._print(f"\nSummary ({auth_type}): No accessible endpoints found")
     
     def check_database_url(self):
         """Check if databaseURL is accessible and writable"""
         if 'databaseURL' not in self.config:
-            print("No databaseURL provided, skipping database checks")
+            self._print("No databaseURL provided, skipping database checks")
             return
         
         database_url = self.config['databaseURL']
-        poc_data = {"poc": self.random_string}
         
-        print(f"\nChecking database URL: {database_url}")
+        self._print(f"\nChecking database URL: {database_url}")
         
-        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
-        headers_list = [{}]
-        if self.id_token:
-            headers_list.append({"Authorization": f"Bearer {self.id_token}"})
-            headers_list.append({"Authorization": f"Firebase {self.id_token}"})
-        
-        for i, headers in enumerate(headers_list):
-            if not headers:
-                auth_type = "anonymous"
-            elif "Bearer" in headers.get("Authorization", ""):
-                auth_type = "authenticated (Bearer)"
-            else:
-                auth_type = "authenticated (Firebase)"
-            
-            # Test with /o/ directory - PUT
-            write_url = f"{database_url}/o/poc_{self.random_string}.json"
-            curl_cmd = f"curl '{write_url}' -XPUT -d '{json.dumps(poc_data)}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Attempting database PUT with /o/ ({auth_type})", curl_cmd)
-            
-            try:
-                response = requests.put(write_url, headers=headers, json=poc_data)
-                if response.status_code == 200:
-                    print(f"✓ Database PUT successful with /o/ ({auth_type}) (status: {response.status_code})")
-                    
-                    # Verify write
-                    verify_response = requests.get(write_url, headers=headers)
-                    if verify_response.status_code == 200:
-                        print(f"✓ Database PUT verified ({auth_type}) (status: {verify_response.status_code})")
-                        print(f"  URL: {write_url}")
-                    else:
-                        print(f"✗ Database PUT verification failed ({auth_type}) (status: {verify_response.status_code})")
-                else:
-                    print(f"✗ Database PUT failed with /o/ ({auth_type}) (status: {response.status_code})")
-            except Exception as e:
-                print(f"✗ Database PUT error with /o/ ({auth_type}): {e}")
-            
-            # Test with /o/ directory - POST
-            post_url = f"{database_url}/o/poc_{self.random_string}_post.json"
-            curl_cmd = f"curl '{post_url}' -XPOST -d '{json.dumps(poc_data)}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Attempting database POST with /o/ ({auth_type})", curl_cmd)
-            
-            try:
-                response = requests.post(post_url, headers=headers, json=poc_data)
-                if response.status_code == 200:
-                    print(f"✓ Database POST successful with /o/ ({auth_type}) (status: {response.status_code})")
-                    # POST usually returns the new key/ID
-                    try:
-                        result = response.json()
-                        print(f"  Created with ID: {result}")
-                    except:
-                        pass
-                else:
-                    print(f"✗ Database POST failed with /o/ ({auth_type}) (status: {response.status_code})")
-            except Exception as e:
-                print(f"✗ Database POST error with /o/ ({auth_type}): {e}")
-            
-            # Test direct write - PUT
-            direct_put_url = f"{database_url}/poc_{self.random_string}.json"
-            curl_cmd = f"curl '{direct_put_url}' -XPUT -d '{json.dumps(poc_data)}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Attempting direct database PUT ({auth_type})", curl_cmd)
-            
-            try:
-                response = requests.put(direct_put_url, headers=headers, json=poc_data)
-                if response.status_code == 200:
-                    print(f"✓ Direct database PUT successful ({auth_type}) (status: {response.status_code})")
+        # Write targets inside the /o/ directory and directly under the root
+        # (method, url, report name, location suffix) of every write attempted; PUT writes are read back
+        writes = [
+            ("PUT", self._urls.db_put_o, "Database PUT", " with /o/"),
+            ("POST", self._urls.db_post_o, "Database POST", " with /o/"),
+            ("PUT", self._urls.db_put_direct, "Direct database PUT", ""),
+            ("POST", self._urls.db_post_direct, "Direct database POST", ""),
+        ]
+        
+        for method, url, name, suffix in writes:
+            def probe_write(auth_type: str, auth_slug: str, headers: Dict[str, str]) -> bool:
+                self._print_debug(f"Attempting {name}{suffix} ({auth_type})",
+                                  lambda: self._curl(url, headers, method=method, data=self._poc_body_str))
+                
+                try:
+                    send = self.session.put if method == "PUT" else self.session.post
+                    response = send(url, headers=headers, data=self._poc_body, timeout=REQUEST_TIMEOUT)
+                    if response.status_code != 200:
+                        self._print(f"✗ {name} failed{suffix} ({auth_type}) (status: {response.status_code})")
+                        return False
+                    self._print(f"✓ {name} successful{suffix} ({auth_type}) (status: {response.status_code})")
                     
-                    # Verify write
-                    verify_response = requests.get(direct_put_url, headers=headers)
-                    if verify_response.status_code == 200:
-                        print(f"✓ Direct database PUT verified ({auth_type}) (status: {verify_response.status_code})")
-                        print(f"  URL: {direct_put_url}")
+                    if method == "PUT":
+                        # Verify write
+                        verify_response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+                        if verify_response.status_code == 200:
+                            self._print(f"✓ {name} verified ({auth_type}) (status: {verify_response.status_code})")
+                            self._print(f"  URL: {url}")
+                        else:
+                            self._print(f"✗ {name} verification failed ({auth_type}) (status: {verify_response.status_code})")
                     else:
-                        print(f"✗ Direct database PUT verification failed ({auth_type}) (status: {verify_response.status_code})")
-                else:
-                    print(f"✗ Direct database PUT failed ({auth_type}) (status: {response.status_code})")
-            except Exception as e:
-                print(f"✗ Direct database PUT error ({auth_type}): {e}")
-            
-            # Test direct write - POST
-            direct_post_url = f"{database_url}/poc_{self.random_string}_post.json"
-            curl_cmd = f"curl '{direct_post_url}' -XPOST -d '{json.dumps(poc_data)}'"
-            if headers:
-                curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-            self._print_debug(f"Attempting direct database POST ({auth_type})", curl_cmd)
+                        # POST usually returns the new key/ID
+                        try:
+                            result = _json_loads(response.content)
+                            self._print(f"  Created with ID: {result}")
+                        except ValueError:
+                            pass
+                    return True
+                except Exception as e:
+                    self._print(f"✗ {name} error{suffix} ({auth_type}): {e}")
+                    return False
             
-            try:
-                response = requests.post(direct_post_url, headers=headers, json=poc_data)
-                if response.status_code == 200:
-                    print(f"✓ Direct database POST successful ({auth_type}) (status: {response.status_code})")
-                    # POST usually returns the new key/ID
-                    try:
-                        result = response.json()
-                        print(f"  Created with ID: {result}")
-                    except:
-                        pass
-                else:
-                    print(f"✗ Direct database POST failed ({auth_type}) (status: {response.status_code})")
-            except Exception as e:
-                print(f"✗ Direct database POST error ({auth_type}): {e}")
+            self._probe_auth_variants(probe_write, extra={'Content-Type': 'application/json'})
     
     def check_remote_config(self):
         """Check if remote config is accessible"""
         if 'apiKey' not in self.config or 'messagingSenderId' not in self.config or 'appId' not in self.config:
-            print("Missing required fields for remote config check (apiKey, messagingSenderId, appId)")
+            self._print("Missing required fields for remote config check (apiKey, messagingSenderId, appId)")
             return
         
-        print(f"\nChecking remote config access")
+        self._print("\nChecking remote config access")
         
-        url = f"https://firebaseremoteconfig.googleapis.com/v1/projects/{self.config['messagingSenderId']}/namespaces/firebase:fetch?key={self.config['apiKey']}"
+        url = self._urls.remote_config
         headers = {'Content-Type': 'application/json'}
         data = {
             "appId": self.config['appId'],
             "appInstanceId": "PROD"
         }
         
-        curl_cmd = f"curl -X POST '{url}' -H 'Content-Type: application/json' --data '{json.dumps(data)}'"
-        self._print_debug(f"Checking remote config", curl_cmd)
+        self._print_debug("Checking remote config", lambda: self._curl(url, headers, method="POST", data=_json_dumps(data)))
         
         try:
-            response = requests.post(url, headers=headers, json=data)
+            response = self.session.post(url, headers=headers, json=data, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 if 'entries' in result:
-                    print(f"✓ Remote config accessible (status: {response.status_code})")
-                    with open('remoteconfig.json', 'w') as f:
-                        json.dump(result, f, indent=2)
-                    print(f"  Config saved to remoteconfig.json")
+                    self._print(f"✓ Remote config accessible (status: {response.status_code})")
+                    filename = f"{self.output_prefix}remoteconfig.json"
+                    with open(filename, 'wb') as f:
+                        f.write(_json_dumps_pretty(result))
+                    self._print(f"  Config saved to {filename}")
                 elif result.get('state') == 'NO_TEMPLATE':
-                    print(f"- Remote config: No template configured (status: {response.status_code})")
+                    self._print(f"- Remote config: No template configured (status: {response.status_code})")
                 else:
-                    print(f"✗ Remote config check: Unknown response (status: {response.status_code})")
+                    self._print(f"✗ Remote config check: Unknown response (status: {response.status_code})")
             else:
-                print(f"✗ Remote config check failed (status: {response.status_code})")
+                self._print(f"✗ Remote config check failed (status: {response.status_code})")
         except Exception as e:
-            print(f"✗ Remote config check error: {e}")
+            self._print(f"✗ Remote config check error: {e}")
     
     def check_crashlytics(self):
         """Check for Crashlytics data access (additional check)"""
         if 'appId' not in self.config or 'apiKey' not in self.config:
-            print("Missing required fields for Crashlytics check")
+            self._print("Missing required fields for Crashlytics check")
             return
         
-        print(f"\nChecking Crashlytics access")
+        self._print("\nChecking Crashlytics access")
         
-        url = f"https://firebasecrashlytics.googleapis.com/v1/projects/{self.config.get('projectId', 'unknown')}/apps/{self.config['appId']}/issues"
+        url = self._urls.crashlytics
         headers = {'X-Goog-Api-Key': self.config['apiKey']}
         
         try:
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                print(f"✓ Crashlytics data accessible (status: {response.status_code})")
+                self._print(f"✓ Crashlytics data accessible (status: {response.status_code})")
             else:
-                print(f"✗ Crashlytics not accessible (status: {response.status_code})")
+                self._print(f"✗ Crashlytics not accessible (status: {response.status_code})")
         except Exception as e:
-            print(f"✗ Crashlytics check error: {e}")
+            self._print(f"✗ Crashlytics check error: {e}")
+    
+    def _firestore_database_exists(self, project_id: str, collections: List[str]) -> bool:
+        """Probe all collections with a single batchGet to detect projects without a Firestore database"""
+        url = self._urls.firestore_batch_get
+        # Placeholder documents: only the database-level outcome of the batch matters here
+        data = {
+            "documents": [f"projects/{project_id}/databases/(default)/documents/{collection}/__dummy__" for collection in collections]
+        }
+        
+        self._print_debug("Checking Firestore database existence",
+                          lambda: self._curl(url, {'Content-Type': 'application/json'}, method="POST", data=_json_dumps(data)))
+        
+        try:
+            response = self.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
+        except Exception:
+            # Inconclusive, fall back to probing each collection
+            return True
+        
+        if response.status_code == 404:
+            self._print(f"- Firestore database not found (status: {response.status_code})")
+            return False
+        if response.status_code == 403 and b'SERVICE_DISABLED' in response.content:
+            self._print(f"- Firestore API disabled for project (status: {response.status_code})")
+            return False
+        return True
     
     def check_firestore_collections(self):
         """Check for accessible Firestore collections"""
         if 'projectId' not in self.config:
-            print("No projectId provided, skipping Firestore collection checks")
+            self._print("No projectId provided, skipping Firestore collection checks")
             return
         
         project_id = self.config['projectId']
         
-        print(f"\nChecking Firestore collections accessibility")
+        self._print("\nChecking Firestore collections accessibility")
         
         # Common collection names to check
-        collections = [
-            "users", "Users", "log", "Log", "logs", "Logs",
-            "upload", "Upload", "uploads", "Uploads", "images", "Images",
-            "files", "Files", "settings", "Settings", "messages", "Messages",
-            "config", "Config"
-        ]
+        collections = _with_casings(FIRESTORE_WORDLIST)
         
-        # Test anonymous, authenticated legacy (Bearer), and modern (Firebase)
-        headers_list = [{}]
-        if self.id_token:
-            headers_list.append({"Authorization": f"Bearer {self.id_token}"})
-            headers_list.append({"Authorization": f"Firebase {self.id_token}"})
-        
-        for i, headers in enumerate(headers_list):
-            if not headers:
-                auth_type = "anonymous"
-            elif "Bearer" in headers.get("Authorization", ""):
-                auth_type = "authenticated (Bearer)"
-            else:
-                auth_type = "authenticated (Firebase)"
+        if not self._firestore_database_exists(project_id, collections):
+            return
+        
+        collection_urls = [f"{self._urls.firestore_documents}/{collection}" for collection in collections]
+        
+        # Probe every (auth, collection) pair concurrently, then report results in order
+        results = iter(self._get_concurrently(
+            [(url, headers) for _, _, headers in self._iter_auth_modes() for url in collection_urls],
+            timeout=REQUEST_TIMEOUT
+        ))
+        
+        for auth_type, auth_slug, headers in self._iter_auth_modes():
             accessible_collections = []
             
             for collection in collections:
-                url = f"https://firestore.googleapis.com/v1/projects/{project_id}/databases/(default)/documents/{collection}"
-                curl_cmd = f"curl '{url}'"
-                if headers:
-                    curl_cmd += f" -H 'Authorization: {headers['Authorization']}'"
-                
-                try:
-                    response = requests.get(url, headers=headers, timeout=10)
-                    if response.status_code == 200:
-                        accessible_collections.append(collection)
-                        print(f"✓ Firestore collection accessible ({auth_type}): {collection} (status: {response.status_code})")
-                        
-                        # Save collection data if it contains content
-                        try:
-                            data = response.json()
-                            if data and 'documents' in data:  # Only save if there are documents
-                                filename = f"firestore-{collection}-{auth_type.replace(' ', '-').replace('(', '').replace(')', '')}.json"
-                                with open(filename, 'w') as f:
-                                    json.dump(data, f, indent=2)
-                                print(f"  Collection data saved to {filename}")
-                        except Exception as e:
-                            print(f"  Could not parse/save collection data: {e}")
-                    elif response.status_code == 401:
-                        print(f"✗ Firestore collection requires auth ({auth_type}): {collection} (status: {response.status_code})")
-                    elif response.status_code == 403:
-                        print(f"✗ Firestore collection access denied ({auth_type}): {collection} (status: {response.status_code})")
-                    elif response.status_code == 404:
-                        # Don't print for 404s as this is expected for non-existent collections
-                        pass
-                    else:
-                        print(f"- Firestore collection ({auth_type}): {collection} (status: {response.status_code})")
-                except requests.exceptions.Timeout:
-                    print(f"- Firestore collection timeout ({auth_type}): {collection}")
-                except Exception as e:
+                response, error = next(results)
+                if isinstance(error, requests.exceptions.Timeout):
+                    self._print(f"- Firestore collection timeout ({auth_type}): {collection}")
+                    continue
+                elif error is not None:
                     # Silently skip connection errors for non-existent collections
+                    continue
+                
+                if response.status_code == 200:
+                    accessible_collections.append(collection)
+                    self._print(f"✓ Firestore collection accessible ({auth_type}): {collection} (status: {response.status_code})")
+                    
+                    # Save collection data if it contains content
+                    try:
+                        if b'"documents"' in response.content:  # Only save if there are documents
+                            filename = f"{self.output_prefix}firestore-{collection}-{auth_slug}.json"
+                            with open(filename, 'wb') as f:
+                                f.write(response.content)
+                            self._print(f"  Collection data saved to {filename}")
+                    except Exception as e:
+                        self._print(f"  Could not save collection data: {e}")
+                elif response.status_code == 401:
+                    self._print(f"✗ Firestore collection requires auth ({auth_type}): {collection} (status: {response.status_code})")
+                elif response.status_code == 403:
+                    self._print(f"✗ Firestore collection access denied ({auth_type}): {collection} (status: {response.status_code})")
+                elif response.status_code == 404:
+                    # Don't print for 404s as this is expected for non-existent collections
                     pass
+                else:
+                    self._print(f"- Firestore collection ({auth_type}): {collection} (status: {response.status_code})")
             
             if accessible_collections:
-                print(f"\nFirestore Summary ({auth_type}): Found {len(accessible_collections)} accessible collections")
+                self._print(f"\nFirestore Summary ({auth_type}): Found {len(accessible_collections)} accessible collections")
             else:
-                print(f"\nFirestore Summary ({auth_type}): No accessible collections found")
+                self._print(f"\nFirestore Summary ({auth_type}): No accessible collections found")
     
     def run_all_checks(self, email: str, password: str):
         """Run all security checks"""
-        print(f"Starting Firebase configuration security tests...\n")
-        print(f"Configuration fields found: {', '.join(self.config.keys())}\n")
+        self._print("Starting Firebase configuration security tests...\n")
+        self._print(f"Configuration fields found: {', '.join(self.config.keys())}\n")
         
         # Check 1: Registration
-        self.check_registration(email, password)
-        
-        # Check 2: Storage bucket access
-        self.check_storage_bucket()
-        
-        # Check 3: Storage upload
-        self.check_storage_upload()
-        
-        # Check 4: Database URL
-        self.check_database_url()
-        
-        # Check 4.5: Database general accessibility
-        self.check_database_accessibility()
-        
-        # Check 5: Remote config
-        self.check_remote_config()
-        
-        # Check 6: Firestore collections
-        self.check_firestore_collections()
-        
-        # Additional checks
-        self.check_crashlytics()
+        self._write_output(self._run_captured(lambda: self.check_registration(email, password)))
+        
+        # The remaining checks only share the id_token obtained above, so run them
+        # concurrently; every check's output is written to stdout in one call, in the usual order
+        checks = [
+            self.check_storage_bucket,           # Check 2: Storage bucket access
+            self.check_storage_upload,           # Check 3: Storage upload
+            self.check_database_url,             # Check 4: Database URL
+            self.check_database_accessibility,   # Check 4.5: Database general accessibility
+            self.check_remote_config,            # Check 5: Remote config
+            self.check_firestore_collections,    # Check 6: Firestore collections
+            self.check_crashlytics,              # Additional checks
+        ]
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for output in executor.map(self._run_captured, checks):
+                self._write_output(output)
         
-        print(f"\nAll checks completed!")
+        self._print("\nAll checks completed!")
 
 
 def parse_firebase_config(config_string: str) -> Dict[str, str]:
     """Parse Firebase configuration from various formats"""
+    # Each caller gets its own dict, so the memoized result can't be mutated through it
+    return dict(_parse_firebase_config(config_string))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_firebase_config(config_string: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse a raw config string once per distinct input, returning its items as an immutable tuple"""
     # Strip any leading/trailing whitespace
     config_string = config_string.strip()
     
-    # First try to parse as valid JSON directly
-    try:
-        config = json.loads(config_string)
-        return config
-    except json.JSONDecodeError:
-        pass
+    # First try to parse as valid JSON directly, but only when the input opens like a JSON object
+    # ('{' followed by a quoted key); JS-style input would just fail and be parsed again below
+    if _RE_JSON_OBJECT_START.match(config_string):
+        try:
+            config = _json_loads(config_string)
+            if isinstance(config, dict):
+                return tuple(config.items())
+        except json.JSONDecodeError:
+            pass
     
     # Remove comments and clean up the string (but preserve URLs and quoted strings)
-    lines = []
-    for line in config_string.split('\n'):
-        # More sophisticated comment removal that preserves URLs
-        cleaned_line = ""
-        in_quotes = False
-        quote_char = None
-        i = 0
-        
-        while i < len(line):
-            char = line[i]
-            
-            # Handle quotes
-            if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-                cleaned_line += char
-                i += 1
-            # Handle // comments (only outside quotes)
-            elif not in_quotes and char == '/' and i + 1 < len(line) and line[i + 1] == '/':
-                # Check if this is part of a protocol (preceded by :)
-                if i > 0 and line[i-1] == ':':
-                    # This is likely a URL, keep it
-                    cleaned_line += char
-                    i += 1
-                else:
-                    # This is a comment, stop processing this line
-                    break
-            else:
-                cleaned_line += char
-                i += 1
-        
-        # Remove /* */ style comments (simple approach for now)
-        cleaned_line = re.sub(r'/\*.*?\*/', '', cleaned_line)
-        lines.append(cleaned_line)
-    config_string = '\n'.join(lines)
-    
-    # Try robust JavaScript object parsing that handles colons in values
-    try:
-        config = _parse_js_object_string(config_string)
-        if config:
-            return config
-    except Exception:
-        pass
+    if '/' in config_string:
+        config_string = _RE_LINE_COMMENT.sub(lambda match: match.group(1) or '', config_string)
+        config_string = _RE_BLOCK_COMMENT.sub('', config_string)
     
-    # Try to convert JavaScript object notation to valid JSON
-    # This handles multiple formats: unquoted keys, single quotes, etc.
+    # Try to convert JavaScript object notation to valid JSON, so the common unquoted-key and
+    # single-quote forms are decoded by the C JSON parser before any Python-level scanning
     try:
         # Handle cases where the object might not be wrapped in braces
-        if not config_string.strip().startswith('{'):
-            config_string = '{' + config_string + '}'
+        normalized = config_string
+        if not normalized.startswith('{'):
+            normalized = '{' + normalized + '}'
         
         # Step 1: Handle unquoted keys (convert to quoted keys)
         # Match unquoted keys more carefully - only at the beginning of lines or after commas/braces
         # This regex looks for word characters that are followed by optional whitespace and a colon,
         # but only when they're at the start of a line (after whitespace) or after { or ,
-        config_string = re.sub(r'(^|\s|[{,])\s*(\w+)(\s*):', r'\1"\2"\3:', config_string, flags=re.MULTILINE)
+        normalized = _RE_UNQUOTED_KEY.sub(r'\1"\2"\3:', normalized)
         
         # Step 2: Replace single quotes with double quotes for string values
         # Be more careful - only replace single quotes that surround complete values
-        config_string = re.sub(r":\s*'([^']*)'", r': "\1"', config_string)
+        normalized = _RE_SINGLE_QUOTE_VAL.sub(r': "\1"', normalized)
         
         # Step 3: Remove trailing commas before closing braces/brackets
-        config_string = re.sub(r',(\s*[}\]])', r'\1', config_string)
+        normalized = _RE_TRAILING_COMMA.sub(r'\1', normalized)
         
         # Try to parse as JSON
-        config = json.loads(config_string)
-        return config
-        
-    except json.JSONDecodeError as e:
-        # If JSON conversion fails, fall back to regex parsing
+        config = _json_loads(normalized)
+        if isinstance(config, dict) and config:
+            return tuple(config.items())
+    except json.JSONDecodeError:
+        pass
+    
+    # Try robust JavaScript object parsing that handles colons in values
+    try:
+        config = _parse_js_object_string(config_string)
+        if config:
+            return tuple(config.items())
+    except Exception:
         pass
     
     # Fallback: Extract key-value pairs using a more sophisticated line-by-line approach
     config = {}
     
-    for line in config_string.split('\n'):
-        line = line.strip()
-        # Skip empty lines, comments, and braces
-        if not line or line.startswith('#') or line.startswith('//') or line in ['{', '}', ',']:
-            continue
-        
-        # Remove trailing comma if present
-        line = line.rstrip(',')
-        
-        # Find the key-value separator (first colon not inside quotes)
-        if ':' not in line:
-            continue
-        
-        # Parse the line character by character to find the key-value separator
-        key_end = -1
-        in_quotes = False
-        quote_char = None
-        
-        for i, char in enumerate(line):
-            if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-            elif char == ':' and not in_quotes:
-                key_end = i
-                break
-        
-        if key_end == -1:
-            continue
-            
-        # Extract key and value parts
-        key_part = line[:key_end]
-        value_part = line[key_end + 1:]
+    # One pass over the whole string: every non-comment line holding a "key: value" pair
+    # (blank and brace-only lines have no colon, so they never match)
+    for match in _RE_KEY_VALUE_LINE.finditer(config_string):
+        key_part, value_part = match.groups()
         
-        # Clean up the key (remove quotes and whitespace)
-        key = key_part.strip().strip('\'"')
+        # Clean up the key (remove quotes and whitespace in one pass; keys never contain either)
+        key = key_part.translate(_KEY_STRIP)
         
-        # Clean up the value - handle quoted strings properly
-        value = value_part.strip()
-        if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-            # Properly quoted value - remove the outer quotes
-            value = value[1:-1]
+        # Clean up the value (dropping any trailing comma) - a properly quoted value loses its outer quotes
+        value = _unquote(value_part.strip().rstrip(',').strip())
         
-        # Store the key-value pair
+        # Store the key-value pair; interning shares one copy of each key name across batch runs
         if key:
-            config[key] = value
+            config[sys.intern(key)] = value
     
     if config:
-        return config
+        return tuple(config.items())
     
     # If all attempts fail, raise an error
-    raise ValueError("Unable to parse Firebase configuration. Please check the format.\n"
-                   "Supported formats:\n"
-                   '- JSON: {"apiKey":"value","authDomain":"value"}\n'
-                   "- Unquoted keys: {apiKey:'value',authDomain:'value'}\n"
-                   "- Mixed quotes: {apiKey:\"value\",authDomain:'value'}\n"
-                   "- Multiline with whitespace")
+    raise ValueError(_PARSE_ERROR_MSG)
+
+
+def _scan_pairs(content: str) -> List[Tuple[int, int, int, int]]:
+    """
+    Scan the body of a JS-like object in one tokenizer pass, splitting on commas and the first colon
+    of each pair (both outside quoted strings). Returns (key_start, key_end, value_start, value_end) offsets.
+    """
+    spans = []
+    pair_start = 0
+    colon_pos = -1
+    
+    # Quoted strings are matched whole, so separators inside them never surface as tokens
+    for token in _RE_JS_TOKEN.finditer(content):
+        kind = token.lastgroup
+        if kind == 'COLON':
+            if colon_pos == -1:
+                colon_pos = token.start()
+        elif kind == 'COMMA':
+            # Pairs without a colon are malformed and skipped
+            if colon_pos != -1:
+                spans.append((pair_start, colon_pos, colon_pos + 1, token.start()))
+            pair_start = token.end()
+            colon_pos = -1
+    
+    # Don't forget the last pair
+    if colon_pos != -1:
+        spans.append((pair_start, colon_pos, colon_pos + 1, len(content)))
+    
+    return spans
 
 
 def _parse_js_object_string(js_string: str) -> Dict[str, str]:
@@ -834,141 +1073,113 @@ def _parse_js_object_string(js_string: str) -> Dict[str, str]:
     if content.startswith('{') and content.endswith('}'):
         content = content[1:-1]
     
-    # Dictionary to store results
     result = {}
     
-    # Split by commas, but respect quoted strings
-    pairs = []
-    current_pair = ""
-    in_quotes = False
-    escape_next = False
-    
-    for char in content:
-        if escape_next:
-            current_pair += char
-            escape_next = False
-            continue
-            
-        if char == '\\':
-            current_pair += char
-            escape_next = True
-            continue
-            
-        if char == '"':
-            in_quotes = not in_quotes
-            current_pair += char
-        elif char == ',' and not in_quotes:
-            if current_pair.strip():
-                pairs.append(current_pair.strip())
-            current_pair = ""
-        else:
-            current_pair += char
-    
-    # Don't forget the last pair
-    if current_pair.strip():
-        pairs.append(current_pair.strip())
-    
-    # Parse each key-value pair
-    for pair in pairs:
-        # Find the first colon that's not inside quotes
-        colon_pos = -1
-        in_quotes = False
-        escape_next = False
-        
-        for i, char in enumerate(pair):
-            if escape_next:
-                escape_next = False
-                continue
-                
-            if char == '\\':
-                escape_next = True
-                continue
-                
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == ':' and not in_quotes:
-                colon_pos = i
-                break
-        
-        if colon_pos == -1:
-            continue  # Skip malformed pairs
-        
-        # Extract key and value
-        key_part = pair[:colon_pos].strip()
-        value_part = pair[colon_pos + 1:].strip()
-        
-        # Remove quotes from key if present
-        if key_part.startswith('"') and key_part.endswith('"'):
-            key = key_part[1:-1]
-        else:
-            key = key_part
-        
-        # Remove quotes from value if present
-        if value_part.startswith('"') and value_part.endswith('"'):
-            value = value_part[1:-1]
-        else:
-            value = value_part
+    for key_start, key_end, value_start, value_end in _scan_pairs(content):
+        key_part = content[key_start:key_end].strip()
+        value_part = content[value_start:value_end].strip()
         
-        result[key] = value
+        # Remove quotes from key and value if present
+        result[_unquote(key_part)] = _unquote(value_part)
     
     return result
 
 
+# Individual CLI arguments: (flag, argparse dest, config field it sets, help text).
+# Both the parser options and the config overrides are generated from this table.
+_CLI_TO_CONFIG = (
+    ('--api-key', 'api_key', 'apiKey', 'Firebase API key'),
+    ('--auth-domain', 'auth_domain', 'authDomain', 'Firebase auth domain'),
+    ('--database-url', 'database_url', 'databaseURL', 'Firebase database URL'),
+    ('--project-id', 'project_id', 'projectId', 'Firebase project ID'),
+    ('--storage-bucket', 'storage_bucket', 'storageBucket', 'Firebase storage bucket'),
+    ('--sender-id', 'sender_id', 'messagingSenderId', 'Firebase messaging sender ID'),
+    ('--app-id', 'app_id', 'appId', 'Firebase app ID'),
+    ('--measurement-id', 'measurement_id', 'measurementId', 'Firebase measurement ID'),
+)
+
+
+def _apply_arg_overrides(config: Dict[str, str], args: argparse.Namespace):
+    """Override config fields with the individual arguments that were provided"""
+    for _, dest, config_key, _ in _CLI_TO_CONFIG:
+        value = getattr(args, dest)
+        if value:
+            config[config_key] = value
+
+
+def _run_configs_file(args: argparse.Namespace):
+    """Test every config in --configs-file in turn, one line per config ('#' lines are skipped)"""
+    try:
+        with open(args.configs_file) as f:
+            config_strings = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+    except OSError as e:
+        print(f"Error reading configs file: {e}")
+        sys.exit(1)
+    
+    for index, config_string in enumerate(config_strings, 1):
+        try:
+            config = parse_firebase_config(config_string)
+        except Exception as e:
+            print(f"\nSkipping config {index}/{len(config_strings)}: {e}")
+            continue
+        _apply_arg_overrides(config, args)
+        
+        # Parsed values need not be strings (e.g. a numeric projectId in JSON)
+        label = str(config.get('projectId') or f"config{index}")
+        print(f"\n===== Config {index}/{len(config_strings)}: {label} =====")
+        # projectId comes from untrusted input, so keep only file-name-safe characters
+        # before it becomes part of every saved path
+        safe_label = _RE_UNSAFE_FILENAME_CHARS.sub('_', label)
+        # One bad config is reported and skipped instead of aborting the rest of the file
+        try:
+            with FirebaseConfigTester(config, debug=args.debug, verify_uploads=args.verify_uploads,
+                                     output_prefix=f"{index}-{safe_label}-") as tester:
+                tester.run_all_checks(args.email, args.password)
+        except Exception as e:
+            print(f"\nSkipping config {index}/{len(config_strings)}: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Test Firebase configurations for security misconfigurations')
     
     # Configuration input methods
     parser.add_argument('--firebase-config', type=str, help='Firebase config as JSON string')
-    parser.add_argument('--api-key', type=str, help='Firebase API key')
-    parser.add_argument('--auth-domain', type=str, help='Firebase auth domain')
-    parser.add_argument('--database-url', type=str, help='Firebase database URL')
-    parser.add_argument('--project-id', type=str, help='Firebase project ID')
-    parser.add_argument('--storage-bucket', type=str, help='Firebase storage bucket')
-    parser.add_argument('--sender-id', type=str, help='Firebase messaging sender ID')
-    parser.add_argument('--app-id', type=str, help='Firebase app ID')
-    parser.add_argument('--measurement-id', type=str, help='Firebase measurement ID')
+    parser.add_argument('--configs-file', type=str, help='File with one Firebase config per line, each tested in turn')
+    for flag, dest, _, help_text in _CLI_TO_CONFIG:
+        parser.add_argument(flag, dest=dest, type=str, help=help_text)
     
     # Test options
     parser.add_argument('--email', type=str, default='test@bugbounty.com', help='Email for registration test')
     parser.add_argument('--password', type=str, default='TestPassword123!', help='Password for registration test')
     parser.add_argument('-d', '--debug', action='store_true', help='Enable debug output with curl commands')
+    parser.add_argument('--verify-uploads', action='store_true', help='Read back successful storage uploads anonymously')
     
     args = parser.parse_args()
     
+    if args.configs_file:
+        _run_configs_file(args)
+        return
+    
     # Build configuration dictionary
     config = {}
+    debug = args.debug
     
     if args.firebase_config:
         try:
-            print(f"Parsing Firebase configuration...")
-            if args.debug:
+            print("Parsing Firebase configuration...")
+            if debug:
                 print(f"Original config: {args.firebase_config}")
             
             config = parse_firebase_config(args.firebase_config)
             
-            if args.debug:
+            if debug:
                 print(f"Parsed config: {json.dumps(config, indent=2)}")
         except Exception as e:
             print(f"Error parsing Firebase config: {e}")
             sys.exit(1)
     
     # Override with individual arguments if provided
-    if args.api_key:
-        config['apiKey'] = args.api_key
-    if args.auth_domain:
-        config['authDomain'] = args.auth_domain
-    if args.database_url:
-        config['databaseURL'] = args.database_url
-    if args.project_id:
-        config['projectId'] = args.project_id
-    if args.storage_bucket:
-        config['storageBucket'] = args.storage_bucket
-    if args.sender_id:
-        config['messagingSenderId'] = args.sender_id
-    if args.app_id:
-        config['appId'] = args.app_id
-    if args.measurement_id:
-        config['measurementId'] = args.measurement_id
+    _apply_arg_overrides(config, args)
     
     if not config:
         print("No Firebase configuration provided!")
@@ -976,8 +1187,8 @@ def main():
         sys.exit(1)
     
     # Create tester and run checks
-    tester = FirebaseConfigTester(config, debug=args.debug)
-    tester.run_all_checks(args.email, args.password)
+    with FirebaseConfigTester(config, debug=debug, verify_uploads=args.verify_uploads) as tester:
+        tester.run_all_checks(args.email, args.password)
 
 
 if __name__ == '__main__':